@@ -1,11 +1,190 @@
 # Build agent from config
 # agents/builder.py
 
-from langchain.chat_models import ChatOpenAI
-from langchain.agents import initialize_agent, AgentType
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import httpx
+from config import settings
 from config.schema import AgentConfig
-from agents.tools.registry import get_tools_by_names
-from agents.memory import get_memory_if_enabled
+
+# Modul LangChain/OpenAI yang berat di-import di dalam fungsi, supaya
+# `import agents.builder` sendiri ringan (mis. untuk test/script). Biaya import
+# dibayar oleh build pertama, yang dijalankan di worker thread (lihat
+# agents/runner.py) sehingga tidak memblokir event loop.
+if TYPE_CHECKING:
+    from langchain.agents import AgentExecutor
+    from langchain_community.chat_models import ChatOpenAI
+
+# Opsional: cache respons LLM per prompt identik (temperature=0), sehingga
+# langkah ReAct untuk pertanyaan yang berulang tidak memanggil OpenAI lagi.
+if settings.LLM_CACHE_ENABLED:
+    from langchain_core.caches import InMemoryCache
+    from langchain_core.globals import set_llm_cache
+
+    set_llm_cache(InMemoryCache(maxsize=settings.LLM_CACHE_MAX))
+
+# Satu connection pool HTTP untuk semua ChatOpenAI di proses ini
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=settings.OPENAI_MAX_CONNECTIONS,
+    max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE,
+    keepalive_expiry=60,
+)
+_HTTP_CLIENT = httpx.Client(limits=_HTTP_LIMITS)
+_ASYNC_HTTP_CLIENT = httpx.AsyncClient(limits=_HTTP_LIMITS)
+
+logger = logging.getLogger(__name__)
+
+_API_KEY_RE = re.compile(r"^sk-[A-Za-z0-9_\-]{20,}$")
+
+# Cache LRU executor per config; key = digest dari AgentConfig,
+# value = (waktu kedaluwarsa, executor)
+_AGENT_CACHE: OrderedDict[bytes, tuple[float, AgentExecutor]] = OrderedDict()
+_AGENT_CACHE_LOCK = threading.Lock()
+
+# Sumber waktu untuk TTL cache; dipisah supaya bisa diganti di test
+_now = time.monotonic
+
+
+# Digest OPENAI_API_KEY, dihitung sekali saat pertama dipakai. Key asli tidak
+# disimpan di cache mana pun; digest cukup untuk identifikasi di log.
+_API_KEY_HASH: str | None = None
+
+
+def _api_key_hash() -> str:
+    """
+    Validasi format OPENAI_API_KEY lalu kembalikan digest-nya. Key dibaca
+    sekali dari settings, jadi validasi cukup sekali per proses.
+    """
+    global _API_KEY_HASH
+    if _API_KEY_HASH is None:
+        api_key = settings.OPENAI_API_KEY
+        if not api_key or not _API_KEY_RE.match(api_key):
+            raise ValueError("OPENAI_API_KEY belum di-set atau formatnya tidak valid")
+        _API_KEY_HASH = hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+    return _API_KEY_HASH
+
+
+@lru_cache(maxsize=32)
+def _cached_llm(model_name: str, timeout: float, max_retries: int) -> ChatOpenAI:
+    # Client dibuat sendiri karena ChatOpenAI memakai satu http_client untuk
+    # sync & async, sedangkan AsyncOpenAI butuh httpx.AsyncClient.
+    import openai
+    from langchain_community.chat_models import ChatOpenAI
+
+    client_kwargs = {
+        "api_key": settings.OPENAI_API_KEY,
+        "timeout": timeout,
+        "max_retries": max_retries,
+    }
+    llm = ChatOpenAI(
+        model_name=model_name,
+        openai_api_key=settings.OPENAI_API_KEY,
+        temperature=0,
+        request_timeout=timeout,
+        max_retries=max_retries,
+        client=openai.OpenAI(http_client=_HTTP_CLIENT, **client_kwargs).chat.completions,
+        async_client=openai.AsyncOpenAI(
+            http_client=_ASYNC_HTTP_CLIENT, **client_kwargs
+        ).chat.completions,
+    )
+    logger.debug("ChatOpenAI baru: model=%s key=%s", model_name, _api_key_hash()[:8])
+    return llm
+
+
+def _get_llm(model_name: str) -> ChatOpenAI:
+    """
+    Ambil ChatOpenAI yang di-share per (model, timeout, max_retries),
+    sehingga client OpenAI dan connection pool httpx dipakai ulang antar
+    build_agent. Hal yang spesifik per agent (mis. prompt_cache_key) dikirim
+    lewat llm_kwargs di LLMChain, bukan lewat identitas client.
+    """
+    _api_key_hash()  # validasi OPENAI_API_KEY (sekali per proses)
+    return _cached_llm(model_name, settings.OPENAI_TIMEOUT, settings.OPENAI_MAX_RETRIES)
+
+
+async def warmup_llm() -> None:
+    """
+    Panggilan 1 token lewat client async (pool yang dipakai endpoint /run),
+    supaya request user pertama tidak menanggung DNS/TLS handshake. Dijalankan
+    sekali per proses sebagai background task saat startup (lihat main.py),
+    dibatasi AGENT_WARMUP_TIMEOUT detik.
+    """
+    try:
+        llm = await asyncio.to_thread(_get_llm, settings.AGENT_WARMUP_MODEL)
+        await asyncio.wait_for(
+            llm.ainvoke("ping", max_tokens=1), timeout=settings.AGENT_WARMUP_TIMEOUT
+        )
+    except Exception as exc:
+        logger.warning("Warmup LLM %s gagal: %r", settings.AGENT_WARMUP_MODEL, exc)
+
+
+@lru_cache(maxsize=128)
+def _system_prefix(system_message: str) -> str:
+    """
+    Gabungkan system_message dengan header tool ReAct yang statis. Kurung
+    kurawal di system_message di-escape, karena prefix ini dipakai sebagai
+    template (PromptTemplate) dan bukan variabel prompt.
+    """
+    from langchain.agents.mrkl.prompt import PREFIX as REACT_TOOLS_HEADER
+
+    escaped = system_message.strip().replace("{", "{{").replace("}", "}}")
+    return f"{escaped}\n\n{REACT_TOOLS_HEADER}"
+
+
+def _prompt_cache_key(system_prefix: str) -> str:
+    """Key prompt caching OpenAI; hanya dari bagian system yang statis."""
+    return hashlib.blake2b(system_prefix.encode(), digest_size=16).hexdigest()
+
+
+# Suffix ReAct bawaan + riwayat percakapan (untuk agent dengan memory)
+_MEMORY_SUFFIX = """Begin!
+
+Previous conversation:
+{chat_history}
+
+Question: {input}
+Thought:{agent_scratchpad}"""
+
+
+@lru_cache(maxsize=64)
+def _react_prompt(
+    prefix: str,
+    tool_names: tuple[str, ...],
+    tool_strings: str,
+    memory_enabled: bool,
+):
+    """
+    Prompt ReAct per (prefix, nama tool, memory), setara dengan
+    ZeroShotAgent.create_prompt. `tool_strings` adalah deskripsi tool yang
+    sudah dirender dari tool yang sama dengan yang dijalankan agent.
+    """
+    from langchain.agents.mrkl.prompt import FORMAT_INSTRUCTIONS, SUFFIX
+    from langchain_core.prompts import PromptTemplate
+
+    format_instructions = FORMAT_INSTRUCTIONS.format(tool_names=", ".join(tool_names))
+    suffix = _MEMORY_SUFFIX if memory_enabled else SUFFIX
+    template = f"{prefix}\n\n{tool_strings}\n\n{format_instructions}\n\n{suffix}"
+    if not memory_enabled:
+        return PromptTemplate.from_template(template)
+    return PromptTemplate(
+        template=template,
+        input_variables=["input", "chat_history", "agent_scratchpad"],
+    )
+
+
+def _config_key(config: AgentConfig) -> bytes:
+    return hashlib.blake2b(config.model_dump_json().encode(), digest_size=16).digest()
+
 
 def build_agent(config: AgentConfig):
     """
@@ -14,9 +193,65 @@ def build_agent(config: AgentConfig):
     - system_message (prompt awal system)
     - tools (list nama tool)
     - memory_enabled (True/False)
+
+    Executor untuk config yang sama dipakai ulang dari cache (LRU, dengan
+    batas umur AGENT_CACHE_TTL). Memory bersifat per-percakapan, jadi executor
+    hasil cache dibungkus ulang dengan memory baru.
     """
-    # 1. Inisiasi LLM
-    llm = ChatOpenAI(model_name=config.model_name, temperature=0)
+    key = _config_key(config)
+    now = _now()
+    agent = None
+    with _AGENT_CACHE_LOCK:
+        entry = _AGENT_CACHE.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                agent = entry[1]
+                _AGENT_CACHE.move_to_end(key)
+            else:
+                del _AGENT_CACHE[key]
+
+    if agent is None:
+        # Build di luar lock; kalau thread lain sudah lebih dulu menyimpan
+        # executor untuk key yang sama, pakai milik thread tersebut.
+        built = _create_agent(config)
+        with _AGENT_CACHE_LOCK:
+            entry = _AGENT_CACHE.get(key)
+            if entry is not None and entry[0] > now:
+                agent = entry[1]
+                _AGENT_CACHE.move_to_end(key)
+            else:
+                agent = built
+                _AGENT_CACHE[key] = (now + settings.AGENT_CACHE_TTL, agent)
+                if len(_AGENT_CACHE) > settings.AGENT_CACHE_MAX:
+                    _AGENT_CACHE.popitem(last=False)
+
+    if agent.memory is None:
+        return agent
+
+    from langchain.agents import AgentExecutor
+    from agents.memory import get_memory_if_enabled
+
+    return AgentExecutor.from_agent_and_tools(
+        agent=agent.agent,
+        tools=agent.tools,
+        verbose=agent.verbose,
+        callbacks=agent.callbacks,
+        memory=get_memory_if_enabled(config.memory_enabled),
+    )
+
+
+def _create_agent(config: AgentConfig) -> AgentExecutor:
+    from langchain.agents import AgentExecutor, ZeroShotAgent
+    from langchain.chains import LLMChain
+    from langchain_core.tools import render_text_description
+    from agents.callbacks import LoggingCallbackHandler
+    from agents.memory import get_memory_if_enabled
+    from agents.tools.registry import get_tools_by_names
+
+    prefix = _system_prefix(config.system_message)
+
+    # 1. Ambil LLM (di-share per model + API key)
+    llm = _get_llm(config.model_name)
 
     # 2. Ambil tool dari registry sesuai nama
     tools = get_tools_by_names(config.tools)
@@ -24,13 +259,28 @@ def build_agent(config: AgentConfig):
     # 3. Siapkan memory jika diaktifkan
     memory = get_memory_if_enabled(config.memory_enabled)
 
-    # 4. Inisialisasi agent
-    agent = initialize_agent(
-        tools=tools,
-        llm=llm,
-        agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
-        verbose=True,
-        memory=memory
+    # 4. Inisialisasi agent (ZERO_SHOT_REACT_DESCRIPTION) dengan prompt dari cache
+    tool_names = tuple(t.name for t in tools)
+    prompt = _react_prompt(
+        prefix,
+        tool_names,
+        render_text_description(tools),
+        bool(config.memory_enabled),
+    )
+    agent = ZeroShotAgent(
+        llm_chain=LLMChain(
+            llm=llm,
+            prompt=prompt,
+            # Routing ke shard prompt cache OpenAI yang sama untuk prefix yang sama
+            llm_kwargs={"extra_body": {"prompt_cache_key": _prompt_cache_key(prefix)}},
+        ),
+        allowed_tools=list(tool_names),
     )
 
-    return agent
+    return AgentExecutor.from_agent_and_tools(
+        agent=agent,
+        tools=tools,
+        verbose=settings.AGENT_VERBOSE,
+        callbacks=[LoggingCallbackHandler()],
+        memory=memory,
+    )
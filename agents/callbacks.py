@@ -0,0 +1,23 @@
+# Callback handlers for agent runs
+# agents/callbacks.py
+
+import logging
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+logger = logging.getLogger(__name__)
+
+
+class LoggingCallbackHandler(BaseCallbackHandler):
+    """
+    Log langkah agent lewat `logging` (level DEBUG) sebagai pengganti
+    verbose=True yang mencetak ke stdout.
+    """
+
+    def on_agent_action(self, action, **kwargs) -> None:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("agent action: tool=%s input=%r", action.tool, action.tool_input)
+
+    def on_agent_finish(self, finish, **kwargs) -> None:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("agent finish: %r", finish.return_values.get("output"))
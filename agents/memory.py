@@ -0,0 +1,66 @@
+# Conversation memory
+# agents/memory.py
+
+from typing import Optional
+
+from langchain.memory import ConversationBufferMemory
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    ChatMessage,
+    HumanMessage,
+    SystemMessage,
+)
+
+_MESSAGE_TYPES = {
+    "human": HumanMessage,
+    "ai": AIMessage,
+    "system": SystemMessage,
+}
+
+
+class CompactChatMessageHistory(BaseChatMessageHistory):
+    """
+    Chat history yang menyimpan role dan content di dua list paralel.
+    Objek BaseMessage baru dibuat saat `messages` dibaca, lalu dipakai ulang
+    sampai ada pesan baru.
+    """
+
+    def __init__(self) -> None:
+        self._roles: list[str] = []
+        self._contents: list = []
+        self._messages: Optional[list[BaseMessage]] = None
+
+    @property
+    def messages(self) -> list[BaseMessage]:
+        if self._messages is None:
+            self._messages = [
+                _MESSAGE_TYPES[role](content=content)
+                if role in _MESSAGE_TYPES
+                else ChatMessage(role=role, content=content)
+                for role, content in zip(self._roles, self._contents)
+            ]
+        return self._messages
+
+    def add_message(self, message: BaseMessage) -> None:
+        self._roles.append(message.role if isinstance(message, ChatMessage) else message.type)
+        self._contents.append(message.content)
+        self._messages = None
+
+    def clear(self) -> None:
+        self._roles.clear()
+        self._contents.clear()
+        self._messages = None
+
+
+def get_memory_if_enabled(memory_enabled: bool) -> Optional[ConversationBufferMemory]:
+    """
+    Kembalikan memory percakapan jika diaktifkan, selain itu None.
+    """
+    if not memory_enabled:
+        return None
+    return ConversationBufferMemory(
+        memory_key="chat_history",
+        chat_memory=CompactChatMessageHistory(),
+    )
@@ -1,6 +1,8 @@
 # Run agent loop
 # agents/runner.py
 
+import asyncio
+
 from config.schema import AgentConfig
 from agents.builder import build_agent
 
@@ -11,3 +13,13 @@ def run_custom_agent(config: AgentConfig, message: str) -> str:
     """
     agent = build_agent(config)
     return agent.run(message)
+
+
+async def arun_custom_agent(config: AgentConfig, message: str) -> str:
+    """
+    Async variant of run_custom_agent. The agent is built in a worker thread
+    (a cache miss builds the prompt, LLM and executor synchronously) and then
+    run on the executor's async path, so the run does not block the event loop.
+    """
+    agent = await asyncio.to_thread(build_agent, config)
+    return await agent.arun(message)
@@ -0,0 +1,96 @@
+# Tool result cache
+# agents/tools/cache.py
+
+import functools
+import threading
+import time
+from typing import Any
+
+from config import settings
+from langchain_core.tools import BaseTool
+
+# key = (nama tool, input kanonik) -> (waktu simpan, hasil)
+_TOOL_CACHE: dict[tuple[str, str], tuple[float, Any]] = {}
+_TOOL_CACHE_LOCK = threading.RLock()
+
+# Penanda cache miss (hasil tool boleh None)
+_MISS = object()
+
+# Sumber waktu cache; dipisah supaya bisa diganti di test
+_now = time.monotonic
+
+# Argumen yang diisi LangChain per run, bukan bagian dari input tool
+_RUNTIME_KWARGS = frozenset({"callbacks", "config", "run_manager"})
+
+
+def _cache_key(name: str, args: tuple, kwargs: dict) -> tuple[str, str]:
+    kwargs = sorted((k, v) for k, v in kwargs.items() if k not in _RUNTIME_KWARGS)
+    # Input tunggal (format ReAct zero-shot), positional maupun keyword
+    values = list(args) + [v for _, v in kwargs]
+    if len(values) == 1 and isinstance(values[0], str):
+        return (name, values[0].strip())
+    return (name, repr((args, kwargs)))
+
+
+def _lookup(key: tuple[str, str]):
+    with _TOOL_CACHE_LOCK:
+        hit = _TOOL_CACHE.get(key)
+        if hit is None:
+            return _MISS
+        if _now() - hit[0] > settings.TOOL_CACHE_TTL:
+            del _TOOL_CACHE[key]
+            return _MISS
+        return hit[1]
+
+
+def _store(key: tuple[str, str], result: Any) -> None:
+    with _TOOL_CACHE_LOCK:
+        _TOOL_CACHE[key] = (_now(), result)
+        while len(_TOOL_CACHE) > settings.TOOL_CACHE_MAX:
+            _TOOL_CACHE.pop(next(iter(_TOOL_CACHE)))
+
+
+def cached_tool(tool: BaseTool) -> BaseTool:
+    """
+    Bungkus tool read-only supaya hasil untuk input yang sama (dalam TTL)
+    diambil dari cache, tanpa memanggil tool/API-nya lagi.
+
+    Yang di-cache adalah `func`/`coroutine` milik tool (Tool/StructuredTool),
+    jadi hanya hasil yang sukses yang tersimpan: exception (mis. ToolException)
+    tetap ditangani `handle_tool_error` milik tool di luar cache. Atribut lain
+    (return_direct, handle_tool_error, signature untuk deskripsi di prompt)
+    ikut tersalin. Tool tanpa `func`/`coroutine` dikembalikan apa adanya.
+    """
+    func = getattr(tool, "func", None)
+    coroutine = getattr(tool, "coroutine", None)
+    if func is None and coroutine is None:
+        return tool
+
+    update = {}
+    if func is not None:
+
+        @functools.wraps(func)
+        def _func(*args, **kwargs):
+            key = _cache_key(tool.name, args, kwargs)
+            result = _lookup(key)
+            if result is _MISS:
+                result = func(*args, **kwargs)
+                _store(key, result)
+            return result
+
+        update["func"] = _func
+
+    if coroutine is not None:
+
+        @functools.wraps(coroutine)
+        async def _coroutine(*args, **kwargs):
+            key = _cache_key(tool.name, args, kwargs)
+            result = _lookup(key)
+            if result is _MISS:
+                result = await coroutine(*args, **kwargs)
+                _store(key, result)
+            return result
+
+        update["coroutine"] = _coroutine
+
+    return tool.model_copy(update=update)
@@ -1,8 +1,13 @@
 # Tool registry
 # agents/tools/registry.py
 
+import logging
+
 from .google import google_search_tool
 from .calc import calc_tool
+from .cache import cached_tool
+
+logger = logging.getLogger(__name__)
 
 # Daftarkan semua tool di sini, key = nama tool yang dipakai di config.tools
 TOOL_REGISTRY = {
@@ -10,17 +15,21 @@ TOOL_REGISTRY = {
     "calc": calc_tool,
 }
 
+# Tool read-only yang hasilnya aman di-cache (jangan masukkan tool yang
+# mengirim/menulis data)
+CACHEABLE_TOOLS = frozenset({"google", "calc"})
+
 def get_tools_by_names(names: list[str]):
     """
     Kembalikan daftar tool instance sesuai daftar nama.
-    Abaikan nama yang tidak dikenal.
+    Abaikan nama yang tidak dikenal. Tool di CACHEABLE_TOOLS dibungkus cache hasil.
     """
     tools = []
     for name in names:
         tool = TOOL_REGISTRY.get(name)
         if tool:
-            tools.append(tool)
+            tools.append(cached_tool(tool) if name in CACHEABLE_TOOLS else tool)
         else:
-            # optional: log atau raise error kalau nama tool tidak ada
-            print(f"[WARNING] Tool '{name}' tidak ditemukan di registry")
+            # optional: raise error kalau nama tool tidak ada
+            logger.warning("Tool '%s' tidak ditemukan di registry", name)
     return tools
@@ -1,10 +1,13 @@
 # Pydantic model for agent config
 # config/schema.py
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional
 
 class AgentConfig(BaseModel):
+    # Immutable: config dipakai sebagai dasar cache key di agents/builder.py
+    model_config = ConfigDict(frozen=True)
+
     model_name: str
     system_message: str
     tools: List[str]
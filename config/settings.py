@@ -0,0 +1,33 @@
+# Environment settings, dibaca sekali saat import
+# config/settings.py
+
+import os
+
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
+OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "60"))
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "100"))
+OPENAI_MAX_KEEPALIVE = int(os.getenv("OPENAI_MAX_KEEPALIVE", "50"))
+
+# Cache respons LLM untuk prompt yang identik (lihat agents/builder.py)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "false").lower() == "true"
+LLM_CACHE_MAX = int(os.getenv("LLM_CACHE_MAX", "1024"))
+
+# Jumlah maksimum executor yang disimpan di cache build_agent
+AGENT_CACHE_MAX = int(os.getenv("AGENT_CACHE_MAX", "128"))
+# Umur maksimum (detik) executor di cache sebelum dibangun ulang
+AGENT_CACHE_TTL = float(os.getenv("AGENT_CACHE_TTL", "3600"))
+
+# Cache hasil tool read-only (lihat agents/tools/cache.py)
+TOOL_CACHE_TTL = float(os.getenv("TOOL_CACHE_TTL", "300"))
+TOOL_CACHE_MAX = int(os.getenv("TOOL_CACHE_MAX", "1024"))
+
+# True = AgentExecutor mencetak setiap langkah ke stdout (untuk debugging)
+AGENT_VERBOSE = os.getenv("AGENT_VERBOSE", "false").lower() == "true"
+
+# True = warmup koneksi ke OpenAI sekali saat startup, di background (satu
+# request 1 token ke AGENT_WARMUP_MODEL, ditagih seperti request biasa)
+AGENT_WARMUP = os.getenv("AGENT_WARMUP", "false").lower() == "true"
+AGENT_WARMUP_MODEL = os.getenv("AGENT_WARMUP_MODEL", "gpt-4o-mini")
+# Batas waktu (detik) warmup, termasuk retry
+AGENT_WARMUP_TIMEOUT = float(os.getenv("AGENT_WARMUP_TIMEOUT", "10"))
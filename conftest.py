@@ -0,0 +1,2 @@
+# Root conftest: membuat pytest menambahkan root repo ke sys.path
+# (agents/, config/ diimport sebagai package top-level)
@@ -1,9 +1,25 @@
 # FastAPI entry point
 # main.py
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from agents.builder import warmup_llm
+from config import settings
 from router.agents import router as agents_router
 
-app = FastAPI(title="LangChain Modular Backend")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warmup di background supaya app langsung melayani request; referensi
+    # task disimpan agar tidak di-garbage-collect sebelum selesai
+    warmup = asyncio.create_task(warmup_llm()) if settings.AGENT_WARMUP else None
+    yield
+    if warmup is not None:
+        warmup.cancel()
+
+
+app = FastAPI(title="LangChain Modular Backend", lifespan=lifespan)
 
 # mount router /agents
 app.include_router(agents_router, prefix="/agents", tags=["agents"])
@@ -2,7 +2,7 @@
 # router/agents.py
 from fastapi import APIRouter, HTTPException
 from config.schema import AgentConfig
-from agents.runner import run_custom_agent
+from agents.runner import arun_custom_agent
 # note: nanti load config dari DB via Prisma microservice
 
 router = APIRouter()
@@ -17,5 +17,5 @@ async def run_agent(agent_id: str, payload: dict):
     # TODO: fetch config dari DB (Prisma) berdasarkan agent_id
     # untuk sekarang kita stub config langsung dari payload
     cfg = AgentConfig(**payload.get("config"))
-    result = run_custom_agent(cfg, payload["message"])
+    result = await arun_custom_agent(cfg, payload["message"])
     return {"response": result}
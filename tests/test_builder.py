@@ -0,0 +1,133 @@
+import sys
+import threading
+import types
+
+import pytest
+from langchain_core.language_models import FakeListLLM
+from langchain_core.tools import Tool
+
+from agents import builder
+from config import settings
+from config.schema import AgentConfig
+
+
+def _echo(query: str) -> str:
+    return query
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Registry palsu + LLM palsu, dan cache builder yang kosong."""
+    module = types.ModuleType("agents.tools.registry")
+    module.calls = 0
+    module.before_build = None
+
+    def get_tools_by_names(names):
+        module.calls += 1
+        if module.before_build is not None:
+            module.before_build()
+        return [Tool(name=name, func=_echo, description=f"{name} tool") for name in names]
+
+    module.get_tools_by_names = get_tools_by_names
+    monkeypatch.setitem(sys.modules, "agents.tools.registry", module)
+    monkeypatch.setattr(builder, "_get_llm", lambda model_name: FakeListLLM(responses=["ok"]))
+    builder._AGENT_CACHE.clear()
+    builder._react_prompt.cache_clear()
+    yield module
+    builder._AGENT_CACHE.clear()
+    builder._react_prompt.cache_clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(builder, "_now", lambda: now[0])
+    return now
+
+
+def _config(system_message="You are helpful.", memory_enabled=False):
+    return AgentConfig(
+        model_name="gpt-4o-mini",
+        system_message=system_message,
+        tools=["search"],
+        memory_enabled=memory_enabled,
+    )
+
+
+def test_cache_hit_returns_same_executor(registry):
+    first = builder.build_agent(_config())
+    second = builder.build_agent(_config())
+
+    assert first is second
+    assert registry.calls == 1
+
+
+def test_ttl_expiry_rebuilds(registry, clock, monkeypatch):
+    monkeypatch.setattr(settings, "AGENT_CACHE_TTL", 10)
+    first = builder.build_agent(_config())
+
+    clock[0] += 5
+    assert builder.build_agent(_config()) is first
+
+    clock[0] += 10
+    rebuilt = builder.build_agent(_config())
+    assert rebuilt is not first
+    assert registry.calls == 2
+
+
+def test_overflow_evicts_least_recently_used(registry, monkeypatch):
+    monkeypatch.setattr(settings, "AGENT_CACHE_MAX", 2)
+    a = builder.build_agent(_config("a"))
+    b = builder.build_agent(_config("b"))
+    assert builder.build_agent(_config("a")) is a  # a jadi yang terbaru
+
+    builder.build_agent(_config("c"))  # b yang dibuang
+
+    assert len(builder._AGENT_CACHE) == 2
+    assert builder.build_agent(_config("a")) is a
+    assert builder.build_agent(_config("b")) is not b
+
+
+def test_racing_builds_share_one_executor(registry):
+    # Kedua thread menunggu di sini, jadi keduanya pasti membangun executor
+    barrier = threading.Barrier(2, timeout=5)
+    registry.before_build = barrier.wait
+    results = []
+
+    def build():
+        results.append(builder.build_agent(_config()))
+
+    threads = [threading.Thread(target=build) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert registry.calls == 2
+    assert len(results) == 2
+    assert results[0] is results[1]
+    assert len(builder._AGENT_CACHE) == 1
+
+
+def test_memory_enabled_gets_fresh_memory(registry):
+    first = builder.build_agent(_config(memory_enabled=True))
+    first.memory.chat_memory.add_user_message("hi")
+    second = builder.build_agent(_config(memory_enabled=True))
+
+    assert registry.calls == 1
+    assert first.agent is second.agent
+    assert first.memory is not second.memory
+    assert second.memory.chat_memory.messages == []
+
+
+@pytest.mark.parametrize("memory_enabled", [False, True])
+def test_system_message_with_braces_runs(registry, monkeypatch, memory_enabled):
+    monkeypatch.setattr(
+        builder, "_get_llm", lambda model_name: FakeListLLM(responses=["Final Answer: ok"])
+    )
+    config = _config('Reply as JSON like {"answer": "..."}', memory_enabled=memory_enabled)
+    agent = builder.build_agent(config)
+
+    assert agent.run("hi") == "ok"
+    prompt = agent.agent.llm_chain.prompt.format(input="hi", agent_scratchpad="", chat_history="")
+    assert 'Reply as JSON like {"answer": "..."}' in prompt
@@ -0,0 +1,35 @@
+from langchain_core.messages import AIMessage, ChatMessage, HumanMessage
+
+from agents.memory import CompactChatMessageHistory
+
+
+def test_roles_round_trip():
+    history = CompactChatMessageHistory()
+    history.add_message(HumanMessage(content="q"))
+    history.add_message(AIMessage(content="a"))
+    history.add_message(ChatMessage(role="tool", content="t"))
+
+    human, ai, other = history.messages
+    assert isinstance(human, HumanMessage) and human.content == "q"
+    assert isinstance(ai, AIMessage) and ai.content == "a"
+    assert isinstance(other, ChatMessage) and other.role == "tool"
+
+
+def test_messages_cached_until_new_message():
+    history = CompactChatMessageHistory()
+    history.add_message(HumanMessage(content="q"))
+    first = history.messages
+
+    assert history.messages is first
+
+    history.add_message(AIMessage(content="a"))
+    assert [m.content for m in history.messages] == ["q", "a"]
+
+
+def test_clear():
+    history = CompactChatMessageHistory()
+    history.add_message(HumanMessage(content="q"))
+    assert len(history.messages) == 1
+
+    history.clear()
+    assert history.messages == []
@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+from langchain_core.tools import Tool, ToolException, render_text_description
+from langchain_core.tools import tool as tool_decorator
+
+from agents.tools import cache
+from config import settings
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    cache._TOOL_CACHE.clear()
+    yield
+    cache._TOOL_CACHE.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache, "_now", lambda: now[0])
+    return now
+
+
+def _counting_tool(results):
+    """Tool yang mengembalikan `results` berurutan; exception di-raise."""
+    calls = []
+
+    def search(query: str) -> str:
+        calls.append(query)
+        result = results[len(calls) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    tool = Tool(name="search", func=search, description="Search", handle_tool_error=True)
+    return tool, calls
+
+
+def test_cache_hit_skips_tool():
+    tool, calls = _counting_tool(["a", "b"])
+    cached = cache.cached_tool(tool)
+
+    assert cached.run("q") == "a"
+    assert cached.run(" q ") == "a"
+    assert asyncio.run(cached.arun("q")) == "a"
+    assert calls == ["q"]
+
+
+def test_ttl_expiry_calls_tool_again(clock, monkeypatch):
+    monkeypatch.setattr(settings, "TOOL_CACHE_TTL", 10)
+    tool, calls = _counting_tool(["a", "b"])
+    cached = cache.cached_tool(tool)
+
+    assert cached.run("q") == "a"
+    clock[0] += 5
+    assert cached.run("q") == "a"
+    clock[0] += 10
+    assert cached.run("q") == "b"
+    assert len(calls) == 2
+
+
+def test_tool_exception_is_not_cached():
+    tool, calls = _counting_tool([ToolException("upstream 503"), "ok"])
+    cached = cache.cached_tool(tool)
+
+    assert cached.run("q") == "upstream 503"
+    assert cached.run("q") == "ok"
+    assert cached.run("q") == "ok"
+    assert len(calls) == 2
+
+
+def test_none_result_is_cached():
+    calls = []
+
+    def lookup(query: str):
+        calls.append(query)
+        return None
+
+    cached = cache.cached_tool(Tool(name="lookup", func=lookup, description="Lookup"))
+    cached.run("q")
+    cached.run("q")
+
+    assert calls == ["q"]
+
+
+def test_positional_and_keyword_input_share_key():
+    calls = []
+
+    @tool_decorator
+    def calc(expr: str) -> str:
+        """Calculator."""
+        calls.append(expr)
+        return expr
+
+    cached = cache.cached_tool(calc)
+
+    assert cached.run("1+1") == "1+1"
+    assert cached.run({"expr": "1+1"}) == "1+1"
+    assert calls == ["1+1"]
+
+
+def test_wrapper_keeps_tool_attributes():
+    tool, _ = _counting_tool(["a"])
+    tool.return_direct = True
+    cached = cache.cached_tool(tool)
+
+    assert cached.return_direct is True
+    assert cached.handle_tool_error is True
+    assert render_text_description([cached]) == render_text_description([tool])